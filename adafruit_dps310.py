@@ -36,25 +36,46 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_DPS310.git"
 
 # Common imports; remove if unused or pylint will complain
 import math
-from time import sleep
+import struct
+from time import sleep, monotonic
 import adafruit_bus_device.i2c_device as i2c_device
 from adafruit_register.i2c_struct import UnaryStruct, ROUnaryStruct
 from adafruit_register.i2c_bit import RWBit, ROBit
-from adafruit_register.i2c_bits import RWBits, ROBits
+from adafruit_register.i2c_bits import RWBits
 
 _DPS310_DEFAULT_ADDRESS = 0x77  # DPS310 default i2c address
 _DPS310_DEVICE_ID = 0x10  # DPS310 device identifier
 
 _DPS310_PRSB2 = 0x00  # Highest byte of pressure data
-_DPS310_TMPB2 = 0x03  # Highest byte of temperature data
 _DPS310_PRSCFG = 0x06  # Pressure configuration
 _DPS310_TMPCFG = 0x07  # Temperature configuration
 _DPS310_MEASCFG = 0x08  # Sensor configuration
 _DPS310_CFGREG = 0x09  # Interrupt/FIFO configuration
 _DPS310_RESET = 0x0C  # Soft reset
 _DPS310_PRODREVID = 0x0D  # Register that contains the part ID
+_DPS310_COEF = 0x10  # First of the calibration coefficient registers
 _DPS310_TMPCOEFSRCE = 0x28  # Temperature calibration src
 
+_DPS310_TMP_EXT = 0x80  # TMP_CFG: temperature measurement source
+_DPS310_COEF_RDY = 0x80  # MEAS_CFG: calibration coefficients available
+_DPS310_SENSOR_RDY = 0x40  # MEAS_CFG: sensor initialization complete
+_DPS310_TMP_RDY = 0x20  # MEAS_CFG: new temperature measurement ready
+_DPS310_PRS_RDY = 0x10  # MEAS_CFG: new pressure measurement ready
+_DPS310_T_SHIFT = 0x08  # CFG_REG: temperature result bit-shift
+_DPS310_P_SHIFT = 0x04  # CFG_REG: pressure result bit-shift
+
+# Compensation scale factors, indexed by SampleCount
+_OVERSAMPLE_SCALEFACTOR = (
+    524288,
+    1572864,
+    3670016,
+    7864320,
+    253952,
+    516096,
+    1040384,
+    2088960,
+)
+
 # pylint: disable=no-member,unnecessary-pass
 
 
@@ -65,18 +86,17 @@ class CV:
     def add_values(cls, value_tuples):
         """Add CV values to the class"""
         cls.string = {}
-        cls.lsb = {}
 
         for value_tuple in value_tuples:
-            name, value, string, lsb = value_tuple
+            name, value, string, _ = value_tuple
             setattr(cls, name, value)
             cls.string[value] = string
-            cls.lsb[value] = lsb
+        cls._valid = frozenset(cls.string)
 
     @classmethod
     def is_valid(cls, value):
         """Validate that a given value is a member"""
-        return value in cls.string
+        return value in cls._valid
 
 
 class Mode(CV):
@@ -165,6 +185,12 @@ class DPS310:
 
     :param ~busio.I2C i2c_bus: The I2C bus the DPS310 is connected to.
     :param int address: The I2C device address. Defaults to :const:`0x77`
+    :param float max_age: The number of seconds a raw pressure and temperature reading can
+        be reused for before the sensor is read again. Defaults to :const:`0.0`, which
+        reads the sensor every time. The cached reading is dropped by :meth:`reset`
+        (and so :meth:`initialize`), by setting :attr:`mode`, the rates or the oversample
+        counts, and when :meth:`wait_temperature_ready` or :meth:`wait_pressure_ready`
+        returns
 
     **Quickstart: Importing and using the DPS310**
 
@@ -183,6 +209,15 @@ class DPS310:
             i2c = board.I2C()   # uses board.SCL and board.SDA
             dps310 = adafruit_dps310.DPS310(i2c)
 
+        or, to run the bus in fast mode where the board supports it
+
+        .. code-block:: python
+
+            import busio
+
+            i2c = busio.I2C(board.SCL, board.SDA, frequency=400000)
+            dps310 = adafruit_dps310.DPS310(i2c)
+
         Now you have access to the :attr:`temperature` and :attr:`pressure` attributes.
 
         .. code-block:: python
@@ -190,11 +225,19 @@ class DPS310:
             temperature = dps310.temperature
             pressure = dps310.pressure
 
+        Both values can also be taken from a single bus read with
+        :attr:`pressure_and_temperature`.
+
+        .. code-block:: python
+
+            pressure, temperature = dps310.pressure_and_temperature
+
     """
     # Register definitions
     _device_id = ROUnaryStruct(_DPS310_PRODREVID, ">B")
     _reset_register = UnaryStruct(_DPS310_RESET, ">B")
     _mode_bits = RWBits(3, _DPS310_MEASCFG, 0)
+    _meas_cfg = UnaryStruct(_DPS310_MEASCFG, ">B")
 
     _pressure_ratebits = RWBits(3, _DPS310_PRSCFG, 4)
     _pressure_osbits = RWBits(4, _DPS310_PRSCFG, 0)
@@ -204,31 +247,29 @@ class DPS310:
 
     _temp_measurement_src_bit = RWBit(_DPS310_TMPCFG, 7)
 
-    _pressure_shiftbit = RWBit(_DPS310_CFGREG, 2)
-    _temp_shiftbit = RWBit(_DPS310_CFGREG, 3)
-
-    _coefficients_ready = RWBit(_DPS310_MEASCFG, 7)
-    _sensor_ready = RWBit(_DPS310_MEASCFG, 6)
     _temp_ready = RWBit(_DPS310_MEASCFG, 5)
     _pressure_ready = RWBit(_DPS310_MEASCFG, 4)
 
-    _raw_pressure = ROBits(24, _DPS310_PRSB2, 0, 3, lsb_first=False)
-    _raw_temperature = ROBits(24, _DPS310_TMPB2, 0, 3, lsb_first=False)
-
     _calib_coeff_temp_src_bit = ROBit(_DPS310_TMPCOEFSRCE, 7)
 
     _reg0e = RWBits(8, 0x0E, 0)
     _reg0f = RWBits(8, 0x0F, 0)
     _reg62 = RWBits(8, 0x62, 0)
 
-    def __init__(self, i2c_bus, address=_DPS310_DEFAULT_ADDRESS):
+    def __init__(self, i2c_bus, address=_DPS310_DEFAULT_ADDRESS, max_age=0.0):
         self.i2c_device = i2c_device.I2CDevice(i2c_bus, address)
+        # shared by the block reads so polling doesn't churn the heap
+        self._buffer = bytearray(18)
+        self._max_age = max_age
+        self._cache_t = None
+        self._cache = (0, 0)
 
         if self._device_id != _DPS310_DEVICE_ID:
             raise RuntimeError("Failed to find DPS310 - check your wiring!")
-        self._pressure_scale = None
-        self._temp_scale = None
+        self._pressure_scale_inv = None
+        self._temp_scale_inv = None
         self._c0 = None
+        self._c0_half = None
         self._c1 = None
         self._c00 = None
         self._c00 = None
@@ -239,16 +280,6 @@ class DPS310:
         self._c20 = None
         self._c21 = None
         self._c30 = None
-        self._oversample_scalefactor = (
-            524288,
-            1572864,
-            3670016,
-            7864320,
-            253952,
-            516096,
-            1040384,
-            2088960,
-        )
         self.sea_level_pressure = 1013.25
         """Pressure in hectoPascals at sea level. Used to calibrate :attr:`altitude`."""
         self.initialize()
@@ -258,15 +289,36 @@ class DPS310:
 
         self.reset()
 
-        self.pressure_rate = Rate.RATE_64_HZ
-        self.pressure_oversample_count = SampleCount.COUNT_64
-        self.temperature_rate = Rate.RATE_64_HZ
-        self.temperature_oversample_count = SampleCount.COUNT_64
-        self.mode = Mode.CONT_PRESTEMP
-
+        pressure_rate = Rate.RATE_64_HZ
+        pressure_oversample = SampleCount.COUNT_64
+        temperature_rate = Rate.RATE_64_HZ
+        temperature_oversample = SampleCount.COUNT_64
+        self._pressure_scale_inv = 1.0 / _OVERSAMPLE_SCALEFACTOR[pressure_oversample]
+        self._temp_scale_inv = 1.0 / _OVERSAMPLE_SCALEFACTOR[temperature_oversample]
+
+        # PRS_CFG, TMP_CFG, MEAS_CFG and CFG_REG are consecutive registers, so
+        # read them once, then write the whole configuration back in one burst
+        buf = self._buffer
+        buf[0] = _DPS310_PRSCFG
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(buf, buf, out_end=1, in_start=1, in_end=5)
+            buf[1] = (pressure_rate << 4) | pressure_oversample
+            # keep the temperature measurement source chosen by reset()
+            tmp_cfg = (temperature_rate << 4) | temperature_oversample
+            buf[2] = (buf[2] & _DPS310_TMP_EXT) | tmp_cfg
+            # stay idle until the result shift bits are in place
+            buf[3] = Mode.IDLE
+            # result shift bits are required above 8x oversampling
+            buf[4] &= ~(_DPS310_P_SHIFT | _DPS310_T_SHIFT)
+            if pressure_oversample > SampleCount.COUNT_8:
+                buf[4] |= _DPS310_P_SHIFT
+            if temperature_oversample > SampleCount.COUNT_8:
+                buf[4] |= _DPS310_T_SHIFT
+            i2c.write(buf, end=5)
+
+        self._meas_cfg = Mode.CONT_PRESTEMP
         # wait until we have at least one good measurement
-        self.wait_temperature_ready()
-        self.wait_pressure_ready()
+        self._wait_meas_cfg(_DPS310_TMP_RDY | _DPS310_PRS_RDY)
 
     # (https://github.com/Infineon/DPS310-Pressure-Sensor#temperature-measurement-issue)
     # similar to DpsClass::correctTemp(void) from infineon's c++ library
@@ -281,43 +333,75 @@ class DPS310:
         # perform a temperature measurement
         # the most recent temperature will be saved internally
         # and used for compensation when calculating pressure
-        _unused = self._raw_temperature
+        self._read_prs_tmp()
 
     def reset(self):
         """Reset the sensor"""
+        # also drop the cache up front so the temperature correction reads the sensor
+        self._cache_t = None
         self._reset_register = 0x89
         # wait for hardware reset to finish
         sleep(0.010)
-        while not self._sensor_ready:
-            sleep(0.001)
+        self._wait_meas_cfg(_DPS310_SENSOR_RDY)
         self._correct_temp()
         self._read_calibration()
         # make sure we're using the temperature source used for calibration
         self._temp_measurement_src_bit = self._calib_coeff_temp_src_bit
+        self._cache_t = None
 
     @property
     def pressure(self):
         """Returns the current pressure reading in hPA"""
 
-        temp_reading = self._raw_temperature
-        raw_temperature = self._twos_complement(temp_reading, 24)
-        pressure_reading = self._raw_pressure
-        raw_pressure = self._twos_complement(pressure_reading, 24)
-        _scaled_rawtemp = raw_temperature / self._temp_scale
-
-        _temperature = _scaled_rawtemp * self._c1 + self._c0 / 2.0
+        # cache the coefficients in locals; attribute lookups are slow on CircuitPython
+        c00 = self._c00
+        c10 = self._c10
+        c20 = self._c20
+        c30 = self._c30
+        c01 = self._c01
+        c11 = self._c11
+        c21 = self._c21
 
-        p_red = raw_pressure / self._pressure_scale
+        raw_pressure, raw_temperature = self._read_prs_tmp()
+        _scaled_rawtemp = raw_temperature * self._temp_scale_inv
+        p_red = raw_pressure * self._pressure_scale_inv
 
         pres_calc = (
-            self._c00
-            + p_red * (self._c10 + p_red * (self._c20 + p_red * self._c30))
-            + _scaled_rawtemp * (self._c01 + p_red * (self._c11 + p_red * self._c21))
+            c00
+            + p_red * (c10 + p_red * (c20 + p_red * c30))
+            + _scaled_rawtemp * (c01 + p_red * (c11 + p_red * c21))
         )
 
-        final_pressure = pres_calc / 100
+        final_pressure = pres_calc * 0.01
         return final_pressure
 
+    @property
+    def pressure_and_temperature(self):
+        """The current pressure in hPa and temperature in degrees Celsius as a
+        ``(pressure, temperature)`` tuple, both taken from a single bus read"""
+
+        # cache the coefficients in locals; attribute lookups are slow on CircuitPython
+        c00 = self._c00
+        c10 = self._c10
+        c20 = self._c20
+        c30 = self._c30
+        c01 = self._c01
+        c11 = self._c11
+        c21 = self._c21
+
+        raw_pressure, raw_temperature = self._read_prs_tmp()
+        _scaled_rawtemp = raw_temperature * self._temp_scale_inv
+        p_red = raw_pressure * self._pressure_scale_inv
+
+        pres_calc = (
+            c00
+            + p_red * (c10 + p_red * (c20 + p_red * c30))
+            + _scaled_rawtemp * (c01 + p_red * (c11 + p_red * c21))
+        )
+
+        _temperature = _scaled_rawtemp * self._c1 + self._c0_half
+        return pres_calc * 0.01, _temperature
+
     @property
     def altitude(self):
         """The altitude based on the sea level pressure (:attr:`sea_level_pressure`) -
@@ -327,8 +411,9 @@ class DPS310:
     @property
     def temperature(self):
         """The current temperature reading in degrees Celsius"""
-        _scaled_rawtemp = self._raw_temperature / self._temp_scale
-        _temperature = _scaled_rawtemp * self._c1 + self._c0 / 2.0
+        _, raw_temperature = self._read_prs_tmp()
+        _scaled_rawtemp = raw_temperature * self._temp_scale_inv
+        _temperature = _scaled_rawtemp * self._c1 + self._c0_half
         return _temperature
 
     @property
@@ -355,6 +440,7 @@ class DPS310:
             )
         while self._temp_ready is False:
             sleep(0.001)
+        self._cache_t = None
 
     @property
     def pressure_ready(self):
@@ -380,6 +466,7 @@ class DPS310:
             )
         while self._pressure_ready is False:
             sleep(0.001)
+        self._cache_t = None
 
     @property
     def mode(self):
@@ -392,6 +479,7 @@ class DPS310:
             raise AttributeError("mode must be an `Mode`")
 
         self._mode_bits = value
+        self._cache_t = None
 
     @property
     def pressure_rate(self):
@@ -403,6 +491,7 @@ class DPS310:
         if not Rate.is_valid(value):
             raise AttributeError("pressure_rate must be a Rate")
         self._pressure_ratebits = value
+        self._cache_t = None
 
     @property
     def pressure_oversample_count(self):
@@ -414,9 +503,10 @@ class DPS310:
         if not SampleCount.is_valid(value):
             raise AttributeError("pressure_oversample_count must be a SampleCount")
 
-        self._pressure_osbits = value
-        self._pressure_shiftbit = value > SampleCount.COUNT_8
-        self._pressure_scale = self._oversample_scalefactor[value]
+        self._write_oversample(_DPS310_PRSCFG, _DPS310_P_SHIFT, value)
+        # store the reciprocal so readings multiply rather than divide
+        self._pressure_scale_inv = 1.0 / _OVERSAMPLE_SCALEFACTOR[value]
+        self._cache_t = None
 
     @property
     def temperature_rate(self):
@@ -428,6 +518,7 @@ class DPS310:
         if not Rate.is_valid(value):
             raise AttributeError("temperature_rate must be a Rate")
         self._temp_ratebits = value
+        self._cache_t = None
 
     @property
     def temperature_oversample_count(self):
@@ -439,47 +530,96 @@ class DPS310:
         if not SampleCount.is_valid(value):
             raise AttributeError("temperature_oversample_count must be a SampleCount")
 
-        self._temp_osbits = value
-        self._temp_scale = self._oversample_scalefactor[value]
-        self._temp_shiftbit = value > SampleCount.COUNT_8
+        self._write_oversample(_DPS310_TMPCFG, _DPS310_T_SHIFT, value)
+        self._temp_scale_inv = 1.0 / _OVERSAMPLE_SCALEFACTOR[value]
+        self._cache_t = None
+
+    def _write_oversample(self, cfg_register, shift_bit, value):
+        """Set the oversample bits of PRS_CFG or TMP_CFG along with the matching
+        CFG_REG result shift bit, reading both registers in a single transaction"""
+        buf = self._buffer
+        buf[0] = _DPS310_PRSCFG
+        with self.i2c_device as i2c:
+            # buf[1:5] holds PRS_CFG, TMP_CFG, MEAS_CFG and CFG_REG
+            i2c.write_then_readinto(buf, buf, out_end=1, in_start=1, in_end=5)
+            cfg = (buf[1 + cfg_register - _DPS310_PRSCFG] & 0xF0) | value
+            # the shift bit is required above 8x oversampling
+            cfg_reg = buf[4] & ~shift_bit
+            if value > SampleCount.COUNT_8:
+                cfg_reg |= shift_bit
+
+            buf[0] = _DPS310_CFGREG
+            buf[1] = cfg_reg
+            i2c.write(buf, end=2)
+            buf[0] = cfg_register
+            buf[1] = cfg
+            i2c.write(buf, end=2)
+
+    def _read_prs_tmp(self):
+        """Read the raw pressure and temperature registers in one transaction
+        and return them as signed 24-bit values. Readings younger than
+        ``max_age`` seconds are returned from the cache"""
+        now = None
+        if self._max_age:
+            now = monotonic()
+            if self._cache_t is not None and now - self._cache_t < self._max_age:
+                return self._cache
+        buf = self._buffer
+        buf[0] = _DPS310_PRSB2
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(buf, buf, out_end=1, in_end=6)
+        raw_pressure = (buf[0] << 16) | (buf[1] << 8) | buf[2]
+        raw_pressure -= (raw_pressure & 0x800000) << 1
+        raw_temperature = (buf[3] << 16) | (buf[4] << 8) | buf[5]
+        raw_temperature -= (raw_temperature & 0x800000) << 1
+        # only timestamp the cache once the read has succeeded
+        self._cache = (raw_pressure, raw_temperature)
+        self._cache_t = now
+        return self._cache
 
     @staticmethod
     def _twos_complement(val, bits):
-        if val & (1 << (bits - 1)):
-            val -= 1 << bits
+        return val - ((val & (1 << (bits - 1))) << 1)
 
-        return val
+    def _wait_meas_cfg(self, mask):
+        """Poll MEAS_CFG until all the status bits in ``mask`` are set, backing
+        off from 1ms up to 20ms between reads"""
+        _sleep = sleep
+        delay = 0.001
+        while (self._meas_cfg & mask) != mask:
+            _sleep(delay)
+            delay = min(delay * 2, 0.020)
 
     def _read_calibration(self):
 
-        while not self._coefficients_ready:
-            sleep(0.001)
+        self._wait_meas_cfg(_DPS310_COEF_RDY)
 
-        buffer = bytearray(19)
-        coeffs = [None] * 18
-        for offset in range(18):
-            buffer = bytearray(2)
-            buffer[0] = 0x10 + offset
+        # the coefficient registers are contiguous and the register pointer
+        # auto-increments, so they can all be fetched in one transaction
+        coeffs = self._buffer
+        coeffs[0] = _DPS310_COEF
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(coeffs, coeffs, out_end=1)
 
-            with self.i2c_device as i2c:
-
-                i2c.write_then_readinto(buffer, buffer, out_end=1, in_start=1)
-
-                coeffs[offset] = buffer[1]
+        twos_complement = self._twos_complement
 
         self._c0 = (coeffs[0] << 4) | ((coeffs[1] >> 4) & 0x0F)
-        self._c0 = self._twos_complement(self._c0, 12)
+        self._c0 = twos_complement(self._c0, 12)
+        self._c0_half = self._c0 / 2.0
 
-        self._c1 = self._twos_complement(((coeffs[1] & 0x0F) << 8) | coeffs[2], 12)
+        self._c1 = twos_complement(((coeffs[1] & 0x0F) << 8) | coeffs[2], 12)
 
         self._c00 = (coeffs[3] << 12) | (coeffs[4] << 4) | ((coeffs[5] >> 4) & 0x0F)
-        self._c00 = self._twos_complement(self._c00, 20)
+        self._c00 = twos_complement(self._c00, 20)
 
         self._c10 = ((coeffs[5] & 0x0F) << 16) | (coeffs[6] << 8) | coeffs[7]
-        self._c10 = self._twos_complement(self._c10, 20)
-
-        self._c01 = self._twos_complement((coeffs[8] << 8) | coeffs[9], 16)
-        self._c11 = self._twos_complement((coeffs[10] << 8) | coeffs[11], 16)
-        self._c20 = self._twos_complement((coeffs[12] << 8) | coeffs[13], 16)
-        self._c21 = self._twos_complement((coeffs[14] << 8) | coeffs[15], 16)
-        self._c30 = self._twos_complement((coeffs[16] << 8) | coeffs[17], 16)
+        self._c10 = twos_complement(self._c10, 20)
+
+        # the remaining coefficients are plain big-endian signed 16-bit values
+        (
+            self._c01,
+            self._c11,
+            self._c20,
+            self._c21,
+            self._c30,
+        ) = struct.unpack_from(">hhhhh", coeffs, 8)